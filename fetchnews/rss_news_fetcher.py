@@ -4,20 +4,51 @@ RSS News Fetcher
 Fetches news articles from major RSS feeds with image extraction
 """
 import json
+import argparse
+import atexit
+import contextlib
+import copy
 import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
-from urllib.parse import urlparse
+import html
+import io
+from urllib.parse import urlparse, urlsplit, urlunsplit, urljoin, parse_qsl, urlencode
 import os
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import time
 import concurrent.futures
-from threading import Lock
-from playwright.sync_api import sync_playwright
+import functools
+import hashlib
+import sqlite3
+from threading import Lock, BoundedSemaphore, local
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 import re
 from collections import Counter
+from types import MappingProxyType
 import sys
 
+# Optional C-accelerated JSON serializer (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional on-disk HTTP cache for feeds and article pages
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Optional article extractor, tried on the downloaded page before Playwright
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
 # ROBUST import handling for GitHub Actions compatibility
 import sys
 from pathlib import Path
@@ -82,14 +113,499 @@ if RSSHistoryManager is None:
     print(error_msg)
     raise ImportError("RSS History Manager is required for duplicate prevention")
 
+# In-page paragraph extraction for Playwright: walks the content selectors in
+# order until more than 200 characters are collected, then falls back to all
+# paragraphs on the page (capped at ~800 characters)
+_PLAYWRIGHT_EXTRACT_JS = """(selectors) => {
+    let text = '';
+    const seen = new Set();
+    for (const selector of selectors) {
+        let elements;
+        try { elements = document.querySelectorAll(selector); } catch (e) { continue; }
+        if (!elements.length) continue;
+        for (const element of elements) {
+            for (const p of element.querySelectorAll('p')) {
+                if (seen.has(p)) continue;
+                seen.add(p);
+                const t = p.innerText.trim();
+                if (t.length > 50) text += t + ' ';
+            }
+        }
+        if (text.trim().length > 200) return text;
+    }
+    if (text.trim().length < 200) {
+        for (const p of document.querySelectorAll('p')) {
+            if (seen.has(p)) continue;
+            const t = p.innerText.trim();
+            if (t.length > 50) {
+                text += t + ' ';
+                if (text.length > 800) break;
+            }
+        }
+    }
+    return text;
+}"""
+
+def _class_xpath(class_name):
+    """XPath predicate matching elements whose class list contains class_name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+# Common article body containers in priority order, as the CSS selector used
+# in the browser and the XPath yielding its paragraphs (or itself when the
+# container is a <p>) used with lxml
+_CONTENT_SELECTORS = (
+    ('article', "//article/descendant-or-self::p"),
+    ('[data-component="text-block"]', "//*[@data-component='text-block']/descendant-or-self::p"),
+    ('.article-content', f"//*[{_class_xpath('article-content')}]/descendant-or-self::p"),
+    ('.post-content', f"//*[{_class_xpath('post-content')}]/descendant-or-self::p"),
+    ('.entry-content', f"//*[{_class_xpath('entry-content')}]/descendant-or-self::p"),
+    ('.content', f"//*[{_class_xpath('content')}]/descendant-or-self::p"),
+    ('.story-body', f"//*[{_class_xpath('story-body')}]/descendant-or-self::p"),
+    ('.article-body', f"//*[{_class_xpath('article-body')}]/descendant-or-self::p"),
+    ('[data-module="ArticleBody"]', "//*[@data-module='ArticleBody']/descendant-or-self::p"),
+    ('.gel-body-copy', f"//*[{_class_xpath('gel-body-copy')}]/descendant-or-self::p"),
+    ('main', "//main//p"),
+    ('.main-content', f"//*[{_class_xpath('main-content')}]//p"),
+)
+_CONTENT_CSS_SELECTORS = tuple(css for css, _ in _CONTENT_SELECTORS)
+_CONTENT_XPATHS = tuple(etree.XPath(xpath) for _, xpath in _CONTENT_SELECTORS)
+_ALL_PARAGRAPHS_XPATH = etree.XPath('//p')
+
+# Resource types the Playwright fallback never needs to download
+_PLAYWRIGHT_BLOCKED_RESOURCES = frozenset({'image', 'stylesheet', 'font', 'media', 'other'})
+
+# Analytics and ad hosts the Playwright fallback never needs to contact
+_PLAYWRIGHT_BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'hotjar.com',
+    'segment.com',
+    'segment.io',
+)
+
+# Meta tags that carry a page's lead image, in order of preference
+_META_IMAGE_KEYS = (
+    ('property', 'og:image'),
+    ('name', 'twitter:image'),
+    ('property', 'twitter:image'),
+    ('name', 'og:image'),
+)
+_META_IMAGE_XPATH = etree.XPath(
+    "//meta[@property='og:image' or @name='twitter:image' or @property='twitter:image' or @name='og:image']"
+)
+_HERO_IMG_XPATH = etree.XPath(
+    "//img[re:test(@class, 'hero|featured|main|article', 'i')][1]",
+    namespaces={'re': 'http://exslt.org/regular-expressions'}
+)
+_IMG_EXT_RE = re.compile(r'\.(?:jpe?g|png|webp|gif)', re.I)
+
+# First <img src="..."> in a feed summary (not data-src and friends)
+_IMG_SRC_RE = re.compile(r'<img\b[^>]*?(?<![\w-])src\s*=\s*["\']([^"\']+)["\']', re.I)
+
+# Lead image lookups read at most this much of a page before parsing the head
+_HEAD_READ_LIMIT = 65536
+_HEAD_END_RE = re.compile(rb'</head\s*>', re.I)
+
+# Article pages are read up to this many bytes; the text and images we use
+# come well before it, and it bounds memory on oversized or endless responses
+_PAGE_READ_LIMIT = 2 * 1024 * 1024
+
+# Page text this short counts as a failed extraction (MIN_DESCRIPTION_LENGTH
+# in _enrich_article)
+_MIN_PAGE_CONTENT_LENGTH = 300
+
+def _keyword_re(*keywords):
+    """Compile a regex matching any keyword as a substring, like `keyword in text`"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# Title keyword groups for expand_short_description
+_EXPAND_ANNOUNCE_RE = _keyword_re('announces', 'launches', 'unveils', 'reveals')
+_EXPAND_REPORT_RE = _keyword_re('report', 'study', 'research', 'finds')
+_EXPAND_POLICY_RE = _keyword_re('government', 'policy', 'law', 'regulation')
+_EXPAND_MARKET_RE = _keyword_re('market', 'economy', 'financial', 'business')
+_EXPAND_TECH_RE = _keyword_re('technology', 'tech', 'digital', 'ai', 'software')
+_EXPAND_HEALTH_RE = _keyword_re('health', 'medical', 'hospital', 'treatment')
+_EXPAND_CLIMATE_RE = _keyword_re('climate', 'environment', 'green', 'energy')
+_EXPAND_ELECTION_RE = _keyword_re('election', 'political', 'vote', 'campaign')
+
+# Title keyword groups for create_fallback_description
+_FALLBACK_CRICKET_RE = _keyword_re('cricket', 'player', 'batsman', 'bowler', 'match', 'tournament', 'ranji', 'ipl')
+_FALLBACK_TECH_RE = _keyword_re('technology', 'tech', 'ai', 'software', 'digital', 'app')
+_FALLBACK_BUSINESS_RE = _keyword_re('business', 'company', 'market', 'economy', 'financial', 'investment')
+_FALLBACK_POLICY_RE = _keyword_re('government', 'policy', 'political', 'minister', 'parliament', 'law')
+_FALLBACK_HEALTH_RE = _keyword_re('health', 'medical', 'hospital', 'treatment', 'healthcare', 'doctor')
+_FALLBACK_EDUCATION_RE = _keyword_re('education', 'school', 'university', 'student', 'academic', 'research')
+_FALLBACK_ENVIRONMENT_RE = _keyword_re('environment', 'climate', 'green', 'energy', 'sustainability', 'renewable')
+
+_WS_RE = re.compile(r'\s+')
+
+# Read-more style boilerplate stripped from feed summaries
+_UNWANTED_PHRASES = (
+    'Continue reading...',
+    'Read more...',
+    'Click here',
+    'Learn more',
+    'See more',
+    'View more',
+    'Read full article',
+    'Full story',
+    'More details',
+)
+# Any run of whitespace may separate the words, so the text doesn't need
+# normalising before the phrases are removed
+_UNWANTED_PHRASES_RE = re.compile('|'.join(
+    r'\s+'.join(re.escape(word) for word in phrase.split(' ')) for phrase in _UNWANTED_PHRASES
+))
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def _read_only_feeds(feeds):
+    """Wrap a {category: {source_name: feed_url}} mapping so it can't be modified"""
+    return MappingProxyType({category: MappingProxyType(sources) for category, sources in feeds.items()})
+
+def _first_sentences(text, limit):
+    """Cut text after its first `limit` '. '-separated sentences
+
+    Returns (summary, has_multiple_sentences) with the same result as joining
+    text.split('. ')[:limit] plus a final period, without building the list
+    """
+    end = -2
+    for count in range(limit):
+        end = text.find('. ', end + 2)
+        if end == -1:
+            return (text + '.', True) if count else (text, False)
+    return text[:end] + '.', True
+
+def _summarize_text(extracted_content, max_sentences, max_length):
+    """Turn extracted article text into a description of up to max_sentences sentences"""
+    # Remove extra whitespace and create comprehensive summary
+    text = ' '.join(extracted_content.split())
+    content, multiple_sentences = _first_sentences(text, max_sentences)
+    
+    # Increase length limit for better summaries (at least one paragraph)
+    if len(content) > max_length:
+        content = content[:max_length] + '...'
+    
+    # Ensure minimum length for summary apps (around 300 chars)
+    if len(content) < 300 and multiple_sentences:
+        # If still too short, try to get more content
+        content = text + '.'
+    
+    return content.strip()
+
+def _canonicalize_url(url):
+    """Normalise an article URL so syndicated copies of a story share one key"""
+    parts = urlsplit(url.strip())
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not key.lower().startswith('utm_') and key.lower() != 'ref']
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+# Enrichment outcomes in the order the per-feed summary line reports them
+_ENRICH_OUTCOME_LABELS = (
+    ('short', 'short descriptions'),
+    ('requests', 'enhanced via requests'),
+    ('playwright', 'enhanced via Playwright'),
+    ('expanded', 'expanded'),
+    ('fallback', 'fallback descriptions'),
+    ('failed', 'left too short'),
+    ('playwright_skipped', 'Playwright skipped'),
+    ('image_skipped', 'image lookups skipped'),
+)
+
+# Element names read by the direct RSS 2.0 / Atom entry parser
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_ATOM_ENTRY_TAG = _ATOM_NS + 'entry'
+_CONTENT_ENCODED_TAG = '{http://purl.org/rss/1.0/modules/content/}encoded'
+_MEDIA_CONTENT_TAGS = ('{http://search.yahoo.com/mrss/}content', '{http://search.yahoo.com/mrss}content')
+_MEDIA_THUMBNAIL_TAGS = ('{http://search.yahoo.com/mrss/}thumbnail', '{http://search.yahoo.com/mrss}thumbnail')
+
+def _add_media(entry, element):
+    """Copy media:content / media:thumbnail attributes the way feedparser exposes them"""
+    media_content = [dict(media.attrib) for media in element.iter(*_MEDIA_CONTENT_TAGS)]
+    if media_content:
+        entry['media_content'] = media_content
+    media_thumbnail = [dict(media.attrib) for media in element.iter(*_MEDIA_THUMBNAIL_TAGS)]
+    if media_thumbnail:
+        entry['media_thumbnail'] = media_thumbnail
+
+def _rss_entry(item, base_url):
+    """Build a feedparser-style entry from an RSS 2.0 <item>"""
+    entry = feedparser.FeedParserDict()
+    link = guid = None
+    enclosures = []
+    for child in item:
+        if child.tag == 'title':
+            entry['title'] = (child.text or '').strip()
+        elif child.tag == 'link':
+            link = (child.text or '').strip()
+        elif child.tag == 'guid' and child.get('isPermaLink', 'true').lower() != 'false':
+            guid = (child.text or '').strip()
+        elif child.tag == 'description':
+            entry['summary'] = (child.text or '').strip()
+        elif child.tag == 'pubDate':
+            entry['published'] = (child.text or '').strip()
+        elif child.tag == _CONTENT_ENCODED_TAG:
+            entry['content'] = [{'value': child.text or ''}]
+        elif child.tag == 'enclosure':
+            enclosures.append({'rel': 'enclosure', 'href': urljoin(base_url, child.get('url', '')),
+                               'type': child.get('type', '')})
+    
+    # feedparser falls back to a permalink guid and resolves relative links
+    if link or guid:
+        entry['link'] = urljoin(base_url, link or guid)
+    if enclosures:
+        # FeedParserDict derives entry.enclosures from the enclosure links
+        entry['links'] = enclosures
+    if 'summary' not in entry and 'content' in entry:
+        entry['summary'] = entry['content'][0]['value']
+    _add_media(entry, item)
+    return entry
+
+def _atom_text(element, markup=False):
+    """Text of an Atom text construct
+
+    xhtml content is flattened to its text, or with markup=True serialized
+    as HTML without its wrapping <div>, the way feedparser returns it
+    """
+    if element.get('type') != 'xhtml':
+        return element.text or ''
+    if not markup:
+        return ''.join(element.itertext())
+    
+    wrapper = element
+    if len(element) == 1 and etree.QName(element[0]).localname == 'div':
+        wrapper = element[0]
+    # Serialize plain HTML tags rather than xhtml-namespaced ones
+    wrapper = copy.deepcopy(wrapper)
+    for node in wrapper.iter(etree.Element):
+        node.tag = etree.QName(node).localname
+    etree.cleanup_namespaces(wrapper)
+    return html.escape(wrapper.text or '', quote=False) + ''.join(
+        etree.tostring(child, method='html', encoding='unicode') for child in wrapper
+    )
+
+def _atom_entry(element, base_url):
+    """Build a feedparser-style entry from an Atom <entry>"""
+    entry = feedparser.FeedParserDict()
+    enclosures = []
+    for child in element:
+        if child.tag == _ATOM_NS + 'title':
+            entry['title'] = _atom_text(child).strip()
+        elif child.tag == _ATOM_NS + 'link':
+            href = urljoin(base_url, child.get('href', ''))
+            rel = child.get('rel', 'alternate')
+            if rel == 'alternate' and 'link' not in entry:
+                entry['link'] = href
+            elif rel == 'enclosure':
+                enclosures.append({'rel': 'enclosure', 'href': href, 'type': child.get('type', '')})
+        elif child.tag == _ATOM_NS + 'summary':
+            entry['summary'] = _atom_text(child, markup=True).strip()
+        elif child.tag == _ATOM_NS + 'content':
+            entry['content'] = [{'value': _atom_text(child, markup=True)}]
+        elif child.tag == _ATOM_NS + 'published':
+            entry['published'] = (child.text or '').strip()
+    
+    if enclosures:
+        # FeedParserDict derives entry.enclosures from the enclosure links
+        entry['links'] = enclosures
+    if 'summary' not in entry and 'content' in entry:
+        entry['summary'] = entry['content'][0]['value']
+    _add_media(entry, element)
+    return entry
+
+def _parse_feed_entries(content, base_url, limit):
+    """Read the first `limit` entries of an RSS 2.0 or Atom feed with lxml
+
+    Stops parsing once `limit` entries are read. Returns None when the
+    document isn't well-formed RSS 2.0 / Atom, so the caller can fall back to
+    feedparser's more forgiving parser
+    """
+    entries = []
+    try:
+        for _, element in etree.iterparse(io.BytesIO(content), events=('end',), tag=('item', _ATOM_ENTRY_TAG),
+                                          resolve_entities=False, no_network=True):
+            if element.tag == _ATOM_ENTRY_TAG:
+                entries.append(_atom_entry(element, base_url))
+            else:
+                entries.append(_rss_entry(element, base_url))
+            if len(entries) >= limit:
+                break
+            element.clear()
+    except etree.XMLSyntaxError:
+        return None
+    return entries or None
+
 class RSSNewsFetcher:
+    # RSS feeds organized by category - OPTIMIZED: Most Important Sources Only.
+    # Built once for the class and read-only, so instances share one copy
+    RSS_FEEDS = _read_only_feeds({
+        'international': {
+            
+            'The Indian Express World': 'https://indianexpress.com/section/world/feed/'
+        },
+        'technology': {
+            'TechCrunch': 'https://techcrunch.com/feed/',
+            
+            'Ars Technica': 'https://feeds.arstechnica.com/arstechnica/index',
+            'The Indian Express Technology': 'https://indianexpress.com/section/technology/feed/',
+            'The Indian Express Artificial Intelligence': 'https://indianexpress.com/section/technology/artificial-intelligence/feed/'
+        },
+
+        'sports': {
+            'ESPNCricinfo': 'http://www.espncricinfo.com/rss/content/story/feeds/6.xml',
+            'The Indian Express Sports': 'https://indianexpress.com/section/sports/feed/'
+        },
+        'india': {
+            'NDTV': 'https://feeds.feedburner.com/ndtvnews-top-stories',
+            'Times of India': 'https://timesofindia.indiatimes.com/rssfeedstopstories.cms',
+            'The Hindu': 'https://www.thehindu.com/feeder/default.rss',
+            'The Indian Express India': 'https://indianexpress.com/section/india/feed/',
+            'The Indian Express Explained': 'https://indianexpress.com/section/explained/feed/',
+            'India Today': 'https://www.indiatoday.in/rss/home'
+        },
+        'startups': {
+            'Inc42': 'https://inc42.com/feed/'
+        },
+        'entertainment': {
+            'The Indian Express - Entertainment': 'https://indianexpress.com/section/entertainment/feed/',
+            'The Indian Express Art And Culture': 'https://indianexpress.com/section/lifestyle/art-and-culture/feed/',
+            'Pinkvilla': 'https://www.pinkvilla.com/rss.xml'
+        },
+        'politics': {
+            'ThePrint - Politics': 'https://theprint.in/category/politics/feed/',
+            'The Indian Express Politics': 'https://indianexpress.com/section/politics/feed/'
+        },
+        'karnataka': {
+            'Times of India - Karnataka': 'https://timesofindia.indiatimes.com/rssfeeds/-2128833038.cms',
+            'Indian Express - Bangalore': 'https://indianexpress.com/section/cities/bangalore/feed/'
+        },
+        'health': {
+            'ET HealthWorld': 'http://health.economictimes.indiatimes.com/rss/topstories',
+            'The Indian Express - Health': 'https://indianexpress.com/section/lifestyle/health/feed/',
+            
+        },
+        'education_jobs': {
+            'The Indian Express - Education': 'https://indianexpress.com/section/education/feed/',
+            'The Indian Express - Jobs': 'https://indianexpress.com/section/jobs/feed/'
+        },
+    
+        'travel': {
+            'The Indian Express - Travel': 'https://indianexpress.com/section/auto-travel/feed/',
+            
+        },
+        'cricket': {
+            'ESPNcricinfo - India': 'http://www.espncricinfo.com/rss/content/story/feeds/6.xml',
+            'NDTV Sports - Cricket': 'http://sports.ndtv.com/rss/cricket',
+            'The Indian Express Cricket': 'https://indianexpress.com/section/sports/cricket/feed/'
+        },
+        'lifestyle': {
+            'The Indian Express Lifestyle': 'https://indianexpress.com/section/lifestyle/feed/'
+        },
+        'history': {
+            'The Indian Express 40 Years Ago': 'https://indianexpress.com/section/opinion/40-years-ago/feed/'
+        },
+        'ahmedabad': {
+            'The Indian Express Ahmedabad': 'https://indianexpress.com/section/cities/ahmedabad/feed/'
+        },
+        'delhi': {
+            'The Indian Express Delhi': 'https://indianexpress.com/section/cities/delhi/feed/'
+        },
+        'mumbai': {
+            'The Indian Express Mumbai': 'https://indianexpress.com/section/cities/mumbai/feed/'
+        }
+    })
+    
+    # Flat (source_name, feed_url, category) tasks, expanded once
+    FEED_TASKS = tuple(
+        (source_name, feed_url, category)
+        for category, feeds in RSS_FEEDS.items()
+        for source_name, feed_url in feeds.items()
+    )
+
     def __init__(self):
-        self.session = requests.Session()
+        self.session = self._create_session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
         })
+        
+        # Pool connections per host so worker threads reuse TCP+TLS sessions,
+        # and retry transient throttling/server errors with backoff
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.lock = Lock()
         
+        # Feed workers and their per-entry pools nest, so cap the total number
+        # of in-flight HTTP requests at the connection pool size
+        self._http_gate = BoundedSemaphore(32)
+        
+        # One long-lived browser for Playwright fallbacks, owned by a dedicated
+        # thread and started lazily on first use
+        self._playwright_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='playwright'
+        )
+        self._pw = None
+        self._browser = None
+        self._context = None
+        self._closed = False
+        # Last resort for callers that never call close(); by the time atexit
+        # handlers run the executor refuses new work, so the browser itself is
+        # stopped by fetch_all_news and close()
+        atexit.register(self.close)
+        
+        # Validators from the previous run so unchanged feeds answer 304
+        self.feed_meta_file = 'data/feed_meta.json'
+        self.feed_cache_dir = 'data/feeds'
+        self._feed_meta = self._load_json(self.feed_meta_file, {})
+        self._feed_articles = {}
+        
+        # Enrichment results per canonical article URL, so a story carried by
+        # several feeds is only fetched once
+        self._enriched_cache = {}
+        self._requests_ok_hosts = set()
+        
+        # Hosts where Playwright recovered text plain requests couldn't, and
+        # Playwright misses per host; a host that keeps failing in the browser
+        # too isn't worth another multi-second render this run
+        self._js_required_hosts = set()
+        self._playwright_misses = Counter()
+        self.max_playwright_misses = 2
+        
+        # Per-host [hits, tries] for article-page image lookups, kept across
+        # runs so hosts that never carry an og:image stop costing a fetch.
+        # Such hosts are still probed every Nth article, and counts are halved
+        # once tries reach the window, so a host that adds images recovers
+        self.host_image_stats_file = 'data/host_image_stats.json'
+        self.host_image_stats = self._load_json(self.host_image_stats_file, {})
+        self.min_image_tries = 20
+        self.min_image_hit_rate = 0.05
+        self.image_reprobe_interval = 10
+        self.image_stats_window = 100
+        self._image_lookups_skipped = Counter()
+        
+        # Seconds each feed took last run; slow feeds are started first so
+        # they don't finish last behind a full worker pool
+        self.feed_durations_file = 'data/feed_durations.json'
+        self.feed_durations = self._load_json(self.feed_durations_file, {})
+        
+        # Extractor results from recent runs; top stories stay in the feeds
+        # for hours, so revisits skip both the download and the parse
+        self.extract_cache_file = 'data/extract_cache.sqlite'
+        self.extract_cache_ttl = 6 * 3600
+        self._extract_cache_local = local()
+        self._init_extract_cache()
+        
         # Initialize SPACE-OPTIMIZED history management
         try:
             from space_optimizer import SpaceOptimizer
@@ -104,364 +620,555 @@ class RSSNewsFetcher:
                 print("🧠 Advanced RSS duplicate detection enabled (file-based)")
             else:
                 print("⚠️  Basic duplicate detection only (RSS History Manager not available)")
+
+    def _create_session(self):
+        """Create the shared HTTP session, backed by an on-disk cache when available"""
+        if requests_cache is None:
+            return requests.Session()
         
-        # RSS feeds organized by category - OPTIMIZED: Most Important Sources Only
-        self.rss_feeds = {
-            'international': {
-                
-                'The Indian Express World': 'https://indianexpress.com/section/world/feed/'
-            },
-            'technology': {
-                'TechCrunch': 'https://techcrunch.com/feed/',
-                
-                'Ars Technica': 'https://feeds.arstechnica.com/arstechnica/index',
-                'The Indian Express Technology': 'https://indianexpress.com/section/technology/feed/',
-                'The Indian Express Artificial Intelligence': 'https://indianexpress.com/section/technology/artificial-intelligence/feed/'
+        os.makedirs('data', exist_ok=True)
+        # Only feeds are cached: they change within minutes, so honour
+        # Cache-Control/ETag from servers and serve stale entries on errors.
+        # Article pages are covered by the extract cache and never stored here
+        session = requests_cache.CachedSession(
+            'data/http_cache',
+            backend='sqlite',
+            expire_after=900,
+            urls_expire_after={
+                '*feeds.*': 900,
+                '*/feed*': 900,
+                '*rss*': 900,
+                '*': requests_cache.DO_NOT_CACHE
             },
+            cache_control=True,
+            stale_if_error=True
+        )
+        # Expired rows are never read again; drop them so the file stays small
+        session.cache.delete(expired=True)
+        return session
 
-            'sports': {
-                'ESPNCricinfo': 'http://www.espncricinfo.com/rss/content/story/feeds/6.xml',
-                'The Indian Express Sports': 'https://indianexpress.com/section/sports/feed/'
-            },
-            'india': {
-                'NDTV': 'https://feeds.feedburner.com/ndtvnews-top-stories',
-                'Times of India': 'https://timesofindia.indiatimes.com/rssfeedstopstories.cms',
-                'The Hindu': 'https://www.thehindu.com/feeder/default.rss',
-                'The Indian Express India': 'https://indianexpress.com/section/india/feed/',
-                'The Indian Express Explained': 'https://indianexpress.com/section/explained/feed/',
-                'India Today': 'https://www.indiatoday.in/rss/home'
-            },
-            'startups': {
-                'Inc42': 'https://inc42.com/feed/'
-            },
-            'entertainment': {
-                'The Indian Express - Entertainment': 'https://indianexpress.com/section/entertainment/feed/',
-                'The Indian Express Art And Culture': 'https://indianexpress.com/section/lifestyle/art-and-culture/feed/',
-                'Pinkvilla': 'https://www.pinkvilla.com/rss.xml'
-            },
-            'politics': {
-                'ThePrint - Politics': 'https://theprint.in/category/politics/feed/',
-                'The Indian Express Politics': 'https://indianexpress.com/section/politics/feed/'
-            },
-            'karnataka': {
-                'Times of India - Karnataka': 'https://timesofindia.indiatimes.com/rssfeeds/-2128833038.cms',
-                'Indian Express - Bangalore': 'https://indianexpress.com/section/cities/bangalore/feed/'
-            },
-            'health': {
-                'ET HealthWorld': 'http://health.economictimes.indiatimes.com/rss/topstories',
-                'The Indian Express - Health': 'https://indianexpress.com/section/lifestyle/health/feed/',
-                
-            },
-            'education_jobs': {
-                'The Indian Express - Education': 'https://indianexpress.com/section/education/feed/',
-                'The Indian Express - Jobs': 'https://indianexpress.com/section/jobs/feed/'
-            },
+    @staticmethod
+    def _feed_key(source_name, feed_url):
+        """Feed cache key; one URL can back several sources (ESPN is both sports and cricket)"""
+        return f"{source_name}|{feed_url}"
+
+    def _feed_cache_file(self, feed_key):
+        """Path of the cached article list for a feed"""
+        return os.path.join(self.feed_cache_dir, hashlib.md5(feed_key.encode('utf-8')).hexdigest() + '.json')
+
+    def _load_json(self, filename, default):
+        """Load a JSON file saved by an earlier run, or default if it's missing or unreadable"""
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def _save_json_state(self, filename, state):
+        """Write a state file for the next run (call with self.lock held)"""
+        if not state:
+            return
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        tmp_filename = filename + '.tmp'
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_filename, filename)
+
+    def _should_look_up_image(self, host):
+        """False when enough lookups on host have almost never found an image,
+        except for every image_reprobe_interval-th article"""
+        with self.lock:
+            hits, tries = self.host_image_stats.get(host, (0, 0))
+            if tries <= self.min_image_tries or hits / tries >= self.min_image_hit_rate:
+                return True
+            self._image_lookups_skipped[host] += 1
+            return self._image_lookups_skipped[host] % self.image_reprobe_interval == 0
+
+    def _record_image_lookup(self, host, found):
+        """Count one article-page image lookup for host"""
+        with self.lock:
+            stats = self.host_image_stats.setdefault(host, [0, 0])
+            stats[0] += 1 if found else 0
+            stats[1] += 1
+            # Halve old counts so recent lookups outweigh them
+            if stats[1] >= self.image_stats_window:
+                stats[0] = (stats[0] + 1) // 2
+                stats[1] //= 2
+
+    def save_host_image_stats(self):
+        """Persist per-host image lookup counters for the next run"""
+        with self.lock:
+            self._save_json_state(self.host_image_stats_file, self.host_image_stats)
+
+    def save_feed_durations(self):
+        """Persist this run's per-feed durations for ordering the next run"""
+        with self.lock:
+            self._save_json_state(self.feed_durations_file, self.feed_durations)
+
+    def save_state(self):
+        """Persist the feed cache, image lookup counters and feed durations for the next run"""
+        self.save_feed_cache()
+        self.save_host_image_stats()
+        self.save_feed_durations()
+
+    def save_feed_cache(self):
+        """Persist feed validators and the articles they describe for the next run"""
+        with self.lock:
+            if not self._feed_articles:
+                return
+            os.makedirs(self.feed_cache_dir, exist_ok=True)
+            for feed_key, articles in self._feed_articles.items():
+                with open(self._feed_cache_file(feed_key), 'w', encoding='utf-8') as f:
+                    json.dump(articles, f, ensure_ascii=False)
+            # Swap the metadata in last so it never points at missing articles;
+            # entries for feeds no longer configured are dropped
+            current_keys = {self._feed_key(source_name, feed_url) for source_name, feed_url, _ in self.FEED_TASKS}
+            meta = {key: value for key, value in self._feed_meta.items() if key in current_keys}
+            self._save_json_state(self.feed_meta_file, meta)
+            self._feed_articles = {}
+
+    def _init_extract_cache(self):
+        """Create the extractor cache table and drop expired rows"""
+        try:
+            os.makedirs(os.path.dirname(self.extract_cache_file), exist_ok=True)
+            with sqlite3.connect(self.extract_cache_file, timeout=10) as conn:
+                # WAL lets the enrichment workers read while another one writes
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS extract (
+                        url TEXT,
+                        kind TEXT,
+                        ts INTEGER,
+                        value TEXT,
+                        PRIMARY KEY (url, kind)
+                    )
+                ''')
+                conn.execute('DELETE FROM extract WHERE ts <= ?', (int(time.time()) - self.extract_cache_ttl,))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️  Extract cache unavailable: {e}")
+            self.extract_cache_file = None
+
+    def _cached_extract(self, kind, url, extractor):
+        """Return extractor(url), reusing a result cached within the TTL"""
+        if not self.extract_cache_file:
+            return extractor(url)
+        
+        key = _canonicalize_url(url)
+        value = self._extract_cache_get(kind, key)
+        if value is None:
+            value = extractor(url)
+            self._extract_cache_put(kind, key, value)
+        return value
+
+    def _cached_extract_page(self, url):
+        """Return extract_article_page(url), reusing cached content and image
+
+        The image is '' when the page is known to have none, and None when
+        only the text was cached; the caller then looks it up like any other
+        article image
+        """
+        if not self.extract_cache_file:
+            content, image_url = self.extract_article_page(url)
+            return content, image_url or ''
+        
+        key = _canonicalize_url(url)
+        content = self._extract_cache_get('content', key)
+        if content is not None:
+            return content, self._extract_cache_get('image', key)
         
-            'travel': {
-                'The Indian Express - Travel': 'https://indianexpress.com/section/auto-travel/feed/',
+        content, image_url = self.extract_article_page(url)
+        self._extract_cache_put('content', key, content)
+        # (None, None) is also what a failed download returns, so only a page
+        # that yielded text counts as known to have no image
+        if content or image_url:
+            self._extract_cache_put('image', key, image_url)
+        return content, image_url or ''
+
+    def _extract_cache_conn(self):
+        """This thread's connection to the extract cache, opened on first use
+
+        The connection is closed when the worker thread exits and its
+        thread-local storage is released
+        """
+        conn = getattr(self._extract_cache_local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.extract_cache_file, timeout=10)
+            self._extract_cache_local.conn = conn
+        return conn
+
+    def _extract_cache_get(self, kind, key):
+        """Cached extractor value for a canonical URL, or None if missing or expired"""
+        try:
+            row = self._extract_cache_conn().execute(
+                'SELECT value FROM extract WHERE url = ? AND kind = ? AND ts > ?',
+                (key, kind, int(time.time()) - self.extract_cache_ttl)
+            ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error:
+            return None
+
+    def _extract_cache_put(self, kind, key, value):
+        """Store an extractor value; failed extractions aren't cached so they
+        are retried, but a page without an image is stored as ''"""
+        if not value:
+            if kind != 'image':
+                return
+            value = ''
+        try:
+            conn = self._extract_cache_conn()
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO extract (url, kind, ts, value) VALUES (?, ?, ?, ?)',
+                    (key, kind, int(time.time()), value)
+                )
+        except sqlite3.Error:
+            pass
+
+    def _http_get(self, url, **kwargs):
+        """GET through the shared session while holding an in-flight request slot"""
+        with self._http_gate:
+            return self.session.get(url, **kwargs)
+
+    def _parse_html_response(self, response, content=None):
+        """Parse a response body with lxml, honouring a charset sent in the headers"""
+        encoding = None
+        if 'charset=' in response.headers.get('content-type', '').lower():
+            encoding = response.encoding
+        parser = lxml.html.HTMLParser(encoding=encoding)
+        if content is None:
+            content = response.content
+        return lxml.html.document_fromstring(content, parser=parser)
+
+    def _find_article_image(self, tree, article_url, include_body=True):
+        """Return the first valid lead image URL in a parsed page, or None"""
+        candidates = []
+        metas = _META_IMAGE_XPATH(tree)
+        for attribute, value in _META_IMAGE_KEYS:
+            element = next((meta for meta in metas if meta.get(attribute) == value), None)
+            if element is not None:
+                candidates.append(element.get('content'))
+        if include_body:
+            for element in _HERO_IMG_XPATH(tree):
+                candidates.append(element.get('src') or element.get('data-src'))
+        
+        for image_url in candidates:
+            if image_url:
+                # Make relative URLs absolute
+                if image_url.startswith('//'):
+                    image_url = 'https:' + image_url
+                elif image_url.startswith('/'):
+                    parsed_url = urlparse(article_url)
+                    image_url = f"{parsed_url.scheme}://{parsed_url.netloc}{image_url}"
                 
-            },
-            'cricket': {
-                'ESPNcricinfo - India': 'http://www.espncricinfo.com/rss/content/story/feeds/6.xml',
-                'NDTV Sports - Cricket': 'http://sports.ndtv.com/rss/cricket',
-                'The Indian Express Cricket': 'https://indianexpress.com/section/sports/cricket/feed/'
-            },
-            'lifestyle': {
-                'The Indian Express Lifestyle': 'https://indianexpress.com/section/lifestyle/feed/'
-            },
-            'history': {
-                'The Indian Express 40 Years Ago': 'https://indianexpress.com/section/opinion/40-years-ago/feed/'
-            },
-            'ahmedabad': {
-                'The Indian Express Ahmedabad': 'https://indianexpress.com/section/cities/ahmedabad/feed/'
-            },
-            'delhi': {
-                'The Indian Express Delhi': 'https://indianexpress.com/section/cities/delhi/feed/'
-            },
-            'mumbai': {
-                'The Indian Express Mumbai': 'https://indianexpress.com/section/cities/mumbai/feed/'
-            }
-        }
+                # Validate image URL
+                if image_url.startswith('http') and _IMG_EXT_RE.search(image_url):
+                    return image_url
+        return None
 
     def extract_image_from_article(self, article_url, timeout=10):
         """Extract image URL from article content"""
         try:
-            response = self.session.get(article_url, timeout=timeout)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Try multiple methods to find images
-                image_selectors = [
-                    ('meta', {'property': 'og:image'}),
-                    ('meta', {'name': 'twitter:image'}),
-                    ('meta', {'property': 'twitter:image'}),
-                    ('meta', {'name': 'og:image'}),
-                    ('img', {'class': lambda x: x and any(term in x.lower() for term in ['hero', 'featured', 'main', 'article'])})
-                ]
-                
-                for tag, attrs in image_selectors:
-                    element = soup.find(tag, attrs)
-                    if element:
-                        if tag == 'meta':
-                            image_url = element.get('content')
-                        else:
-                            image_url = element.get('src') or element.get('data-src')
+            # Stream the page and stop at </head>, where the og:/twitter: meta
+            # tags live; no-store keeps the HTTP cache from reading the full body
+            with self._http_gate:
+                response = self.session.get(
+                    article_url, timeout=timeout, stream=True, headers={'Cache-Control': 'no-store'}
+                )
+                try:
+                    if response.status_code == 200:
+                        buffer = bytearray()
+                        chunks = response.iter_content(8192)
+                        for chunk in chunks:
+                            search_from = max(0, len(buffer) - 8)
+                            buffer.extend(chunk)
+                            if _HEAD_END_RE.search(buffer, search_from) or len(buffer) > _HEAD_READ_LIMIT:
+                                break
                         
+                        image_url = self._find_article_image(
+                            self._parse_html_response(response, bytes(buffer)), article_url, include_body=False
+                        )
                         if image_url:
-                            # Make relative URLs absolute
-                            if image_url.startswith('//'):
-                                image_url = 'https:' + image_url
-                            elif image_url.startswith('/'):
-                                parsed_url = urlparse(article_url)
-                                image_url = f"{parsed_url.scheme}://{parsed_url.netloc}{image_url}"
-                            
-                            # Validate image URL
-                            if image_url.startswith('http') and any(ext in image_url.lower() for ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']):
-                                return image_url
+                            return image_url
+                        
+                        # No usable meta image up front; read the rest of the page
+                        # for a hero <img> (or meta tags past the first 64KB)
+                        for chunk in chunks:
+                            buffer.extend(chunk)
+                            if len(buffer) > _PAGE_READ_LIMIT:
+                                break
+                        return self._find_article_image(
+                            self._parse_html_response(response, bytes(buffer)), article_url
+                        )
+                finally:
+                    response.close()
                             
         except Exception as e:
             print(f"Error extracting image from {article_url}: {e}")
         
         return None
 
+    def _get_page(self, article_url, timeout):
+        """Download an article page, reading at most _PAGE_READ_LIMIT bytes
+
+        Returns (response, body), with body None unless the status is 200
+        """
+        # no-store keeps the HTTP cache from reading the whole body to save it;
+        # extracted results are cached in the extract cache instead
+        with self._http_gate:
+            response = self.session.get(
+                article_url, timeout=timeout, stream=True, headers={'Cache-Control': 'no-store'}
+            )
+            try:
+                if response.status_code != 200:
+                    return response, None
+                buffer = bytearray()
+                for chunk in response.iter_content(65536):
+                    buffer.extend(chunk)
+                    if len(buffer) > _PAGE_READ_LIMIT:
+                        break
+                return response, bytes(buffer)
+            finally:
+                response.close()
+
     def extract_article_content(self, article_url, timeout=15):
         """Extract full article content when description is too short"""
         try:
-            response = self.session.get(article_url, timeout=timeout)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Remove unwanted elements
-                for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
-                    element.decompose()
-                
-                # Try multiple content selectors (common article content containers)
-                content_selectors = [
-                    'article',
-                    '[data-component="text-block"]',
-                    '.article-content',
-                    '.post-content', 
-                    '.entry-content',
-                    '.content',
-                    '.story-body',
-                    '.article-body',
-                    '[data-module="ArticleBody"]',
-                    '.gel-body-copy',
-                    'main p',
-                    '.main-content p'
-                ]
-                
-                extracted_content = ""
-                
-                for selector in content_selectors:
-                    elements = soup.select(selector)
-                    if elements:
-                        # Get text from all matching elements
-                        for element in elements:
-                            # Get all paragraph text
-                            paragraphs = element.find_all('p') if element.name != 'p' else [element]
-                            for p in paragraphs:
-                                text = p.get_text(strip=True)
-                                if text and len(text) > 50:  # Only meaningful paragraphs
-                                    extracted_content += text + " "
-                                    
-                        if len(extracted_content.strip()) > 200:  # If we got good content, break
-                            break
-                
-                # Fallback: get all paragraphs from the page
-                if len(extracted_content.strip()) < 200:
-                    paragraphs = soup.find_all('p')
-                    for p in paragraphs:
-                        text = p.get_text(strip=True)
-                        if text and len(text) > 50:
-                            extracted_content += text + " "
-                            if len(extracted_content) > 500:  # Limit content length
-                                break
-                
-                # Clean up the content
-                if extracted_content:
-                    # Remove extra whitespace and create comprehensive summary
-                    content = ' '.join(extracted_content.split())
-                    
-                    # Split into sentences and take first 8-10 sentences for proper summary
-                    sentences = content.split('. ')
-                    if len(sentences) > 10:
-                        content = '. '.join(sentences[:10]) + '.'
-                    elif len(sentences) > 1:
-                        content = '. '.join(sentences) + '.'
-                    
-                    # Increase length limit for better summaries (at least one paragraph)
-                    if len(content) > 2000:
-                        content = content[:2000] + '...'
-                    
-                    # Ensure minimum length for summary apps (around 300 chars)
-                    if len(content) < 300 and len(sentences) > 1:
-                        # If still too short, try to get more content
-                        content = '. '.join(sentences) + '.'
-                    
-                    return content.strip()
+            response, body = self._get_page(article_url, timeout)
+            if body is not None:
+                return self._extract_page_content(self._parse_html_response(response, body), body, article_url)
                             
         except Exception as e:
             print(f"Error extracting content from {article_url}: {e}")
         
         return None
 
-    def extract_content_with_playwright(self, article_url, timeout=20000):
-        """Extract content using Playwright for JavaScript-heavy sites"""
+    def extract_article_page(self, article_url, timeout=15):
+        """Extract (content, image_url) for an article from a single page download"""
         try:
-            with sync_playwright() as p:
-                # Launch browser in headless mode
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-gpu'
-                    ]
-                )
-                
-                # Create context with custom user agent
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                
-                page = context.new_page()
-                page.set_default_timeout(timeout)
-                
-                # Navigate to the page
-                page.goto(article_url, wait_until='domcontentloaded')
-                
-                # Wait for body to be present
-                page.wait_for_selector('body', timeout=10000)
-                
-                # Try multiple content selectors
-                content_selectors = [
-                    'article',
-                    '[data-component="text-block"]',
-                    '.article-content',
-                    '.post-content', 
-                    '.entry-content',
-                    '.content',
-                    '.story-body',
-                    '.article-body',
-                    '[data-module="ArticleBody"]',
-                    '.gel-body-copy',
-                    'main',
-                    '.main-content'
-                ]
-                
-                extracted_content = ""
-                
-                for selector in content_selectors:
-                    try:
-                        elements = page.query_selector_all(selector)
-                        if elements:
-                            for element in elements:
-                                # Get all paragraph elements within this container
-                                paragraphs = element.query_selector_all('p')
-                                for p in paragraphs:
-                                    text = p.inner_text().strip()
-                                    if text and len(text) > 50:  # Only meaningful paragraphs
-                                        extracted_content += text + " "
+            response, body = self._get_page(article_url, timeout)
+            if body is not None:
+                tree = self._parse_html_response(response, body)
+                # Look up the image first; content extraction strips elements
+                image_url = self._find_article_image(tree, article_url)
+                return self._extract_page_content(tree, body, article_url), image_url
                             
-                            if len(extracted_content.strip()) > 200:  # If we got good content, break
-                                break
-                    except:
+        except Exception as e:
+            print(f"Error extracting content from {article_url}: {e}")
+        
+        return None, None
+
+    def _extract_page_content(self, tree, body, article_url):
+        """Summarise a downloaded page, trying trafilatura on the same bytes when the selectors come up short"""
+        content = self._extract_content_from_tree(tree)
+        if trafilatura is None or (content and len(content) > _MIN_PAGE_CONTENT_LENGTH):
+            return content
+        
+        try:
+            text = trafilatura.extract(
+                body, url=article_url, favor_precision=True, include_comments=False, fast=True
+            )
+        except Exception as e:
+            print(f"Error extracting content with trafilatura from {article_url}: {e}")
+            return content
+        if text and len(text) > len(content or ''):
+            return _summarize_text(text, 10, 2000)
+        return content
+
+    def _extract_content_from_tree(self, tree):
+        """Summarise the article paragraphs in a parsed page (modifies the tree)"""
+        # Remove unwanted elements
+        etree.strip_elements(
+            tree, 'script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement',
+            with_tail=False
+        )
+        
+        # Collect paragraphs and join once; total_len tracks the length
+        # of the space-separated text for the thresholds below
+        parts = []
+        total_len = 0
+        
+        # Try the common article containers in priority order; each
+        # lookup is a precompiled XPath evaluated in C. Containers often
+        # nest (article > .article-body), so each paragraph is used once
+        seen = set()
+        for content_xpath in _CONTENT_XPATHS:
+            paragraphs = content_xpath(tree)
+            if paragraphs:
+                for p in paragraphs:
+                    if p in seen:
                         continue
+                    seen.add(p)
+                    text = p.text_content().strip()
+                    if text and len(text) > 50:  # Only meaningful paragraphs
+                        parts.append(text)
+                        total_len += len(text) + 1
                 
-                # Fallback: get all paragraphs from the page
-                if len(extracted_content.strip()) < 200:
-                    try:
-                        paragraphs = page.query_selector_all('p')
-                        for p in paragraphs:
-                            text = p.inner_text().strip()
-                            if text and len(text) > 50:
-                                extracted_content += text + " "
-                                if len(extracted_content) > 800:  # Limit content length
-                                    break
-                    except:
-                        pass
-                
-                # Clean up the content
-                if extracted_content:
-                    # Remove extra whitespace and create comprehensive summary
-                    content = ' '.join(extracted_content.split())
-                    
-                    # Split into sentences and take first 8-12 sentences for proper summary
-                    sentences = content.split('. ')
-                    if len(sentences) > 12:
-                        content = '. '.join(sentences[:12]) + '.'
-                    elif len(sentences) > 1:
-                        content = '. '.join(sentences) + '.'
-                    
-                    # Increase length limit for better summaries
-                    if len(content) > 2500:
-                        content = content[:2500] + '...'
-                    
-                    # Ensure minimum length for summary apps (around 300 chars)
-                    if len(content) < 300 and len(sentences) > 1:
-                        content = '. '.join(sentences) + '.'
-                    
-                    browser.close()
-                    return content.strip()
-                
-                browser.close()
-                        
+                if total_len - 1 > 200:  # If we got good content, break
+                    break
+        
+        # Fallback: get all paragraphs from the page
+        if total_len - 1 < 200:
+            for p in _ALL_PARAGRAPHS_XPATH(tree):
+                if p in seen:
+                    continue
+                text = p.text_content().strip()
+                if text and len(text) > 50:
+                    parts.append(text)
+                    total_len += len(text) + 1
+                    if total_len > 500:  # Limit content length
+                        break
+        
+        extracted_content = ' '.join(parts)
+        
+        # Clean up the content
+        if extracted_content:
+            # Take first 8-10 sentences for proper summary
+            return _summarize_text(extracted_content, 10, 2000)
+        
+        return None
+
+    def _ensure_playwright(self):
+        """Start the shared Playwright browser and context on first use (Playwright thread only)"""
+        if self._browser is not None and self._browser.is_connected():
+            return
+        
+        if self._pw is None:
+            self._pw = sync_playwright().start()
+        
+        # Launch browser in headless mode
+        self._browser = self._pw.chromium.launch(
+            headless=True,
+            args=[
+                '--no-sandbox',
+                '--disable-dev-shm-usage',
+                '--disable-gpu'
+            ]
+        )
+        
+        # Create context with custom user agent
+        self._context = self._browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            viewport={'width': 1920, 'height': 1080}
+        )
+        
+        # Article text doesn't need images, styles, fonts or media
+        self._context.route("**/*", self._route_playwright_request)
+    
+    def _route_playwright_request(self, route):
+        """Abort requests for resources that don't contribute article text"""
+        request = route.request
+        host = urlsplit(request.url).hostname or ''
+        if (request.resource_type in _PLAYWRIGHT_BLOCKED_RESOURCES
+                or any(blocked in host for blocked in _PLAYWRIGHT_BLOCKED_HOSTS)):
+            route.abort()
+        else:
+            route.continue_()
+    
+    def _stop_playwright(self):
+        """Tear down the shared browser, context and Playwright (Playwright thread only)"""
+        for resource in (self._context, self._browser):
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception:
+                    pass
+        if self._pw is not None:
+            self._pw.stop()
+        self._pw = self._browser = self._context = None
+    
+    def _render_with_playwright(self, article_url, timeout):
+        """Render a page in the shared browser and extract its text (Playwright thread only)"""
+        self._ensure_playwright()
+        
+        page = self._context.new_page()
+        try:
+            page.set_default_timeout(timeout)
+            
+            # Return as soon as the response starts arriving and only wait
+            # for the first paragraph rather than the whole DOM
+            page.goto(article_url, wait_until='commit')
+            try:
+                page.wait_for_selector('p', timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
+            
+            # Walk the DOM inside the page in a single evaluation instead of
+            # one IPC round-trip per selector/element/paragraph
+            extracted_content = page.evaluate(_PLAYWRIGHT_EXTRACT_JS, list(_CONTENT_CSS_SELECTORS))
+        finally:
+            page.close()
+        
+        # Clean up the content
+        if extracted_content:
+            # Take first 8-12 sentences for proper summary
+            return _summarize_text(extracted_content, 12, 2500)
+        
+        return None
+
+    def extract_content_with_playwright(self, article_url, timeout=20000):
+        """Extract content using Playwright for JavaScript-heavy sites"""
+        try:
+            # Playwright's sync API is bound to the thread that started it, so
+            # every render runs on the single thread that owns the browser
+            return self._playwright_executor.submit(
+                self._render_with_playwright, article_url, timeout
+            ).result()
         except Exception as e:
             print(f"Playwright extraction error for {article_url}: {e}")
         
         return None
 
+    def stop_browser(self):
+        """Stop the shared Playwright browser; the next fallback starts a new one"""
+        if self._pw is not None:
+            try:
+                self._playwright_executor.submit(self._stop_playwright).result()
+            except RuntimeError:
+                # Interpreter shutdown already stopped the worker thread; the
+                # Playwright driver and its browser exit with the process
+                pass
+
+    def close(self):
+        """Shut down the shared Playwright browser and release pooled connections"""
+        with self.lock:
+            if self._closed:
+                return
+            self._closed = True
+        
+        self.stop_browser()
+        self._playwright_executor.shutdown(wait=True)
+        self.session.close()
+
     def clean_html_content(self, content):
         """Clean HTML tags, links, and unwanted elements from content"""
         if not content:
             return ""
         
         try:
-            from bs4 import BeautifulSoup
-            import re
-            
-            # Parse HTML content
-            soup = BeautifulSoup(content, 'html.parser')
+            # Parse HTML content (plain text summaries are wrapped in a <div>)
+            tree = lxml.html.fragment_fromstring(content, create_parent='div')
             
             # Remove unwanted elements completely
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'a']):
-                element.decompose()
-            
-            # Get clean text
-            clean_text = soup.get_text(separator=' ', strip=True)
-            
-            # Remove extra whitespace and clean up
-            clean_text = re.sub(r'\s+', ' ', clean_text)
-            
-            # Remove common unwanted phrases
-            unwanted_phrases = [
-                'Continue reading...',
-                'Read more...',
-                'Click here',
-                'Learn more',
-                'See more',
-                'View more',
-                'Read full article',
-                'Full story',
-                'More details'
-            ]
+            etree.strip_elements(
+                tree, etree.Comment, etree.ProcessingInstruction,
+                'script', 'style', 'nav', 'header', 'footer', 'aside', 'a',
+                with_tail=False
+            )
             
-            for phrase in unwanted_phrases:
-                clean_text = clean_text.replace(phrase, '')
+            # Get clean text without the common unwanted phrases
+            clean_text = _UNWANTED_PHRASES_RE.sub(
+                '', ' '.join(text.strip() for text in tree.itertext() if text.strip())
+            )
             
-            # Clean up any remaining artifacts
-            clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-            
-            return clean_text
+            # Collapse whitespace (including gaps left by removed phrases)
+            return _WS_RE.sub(' ', clean_text).strip()
             
         except Exception as e:
             print(f"Error cleaning HTML content: {e}")
             # Fallback: basic HTML tag removal
-            import re
-            clean_text = re.sub(r'<[^>]+>', '', content)
-            clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+            clean_text = _HTML_TAG_RE.sub('', content)
+            clean_text = _WS_RE.sub(' ', clean_text).strip()
             return clean_text
 
     def expand_short_description(self, title, short_description):
@@ -489,31 +1196,31 @@ class RSSNewsFetcher:
             desc_lower = description.lower()
             
             # Add relevant context based on keywords in title/description
-            if any(word in title_lower for word in ['announces', 'launches', 'unveils', 'reveals']):
+            if _EXPAND_ANNOUNCE_RE.search(title_lower):
                 if 'company' in desc_lower or 'firm' in desc_lower:
                     expanded_parts.append("This announcement represents a significant development in the company's strategic initiatives.")
                 else:
                     expanded_parts.append("This announcement marks an important milestone in the ongoing developments.")
             
-            if any(word in title_lower for word in ['report', 'study', 'research', 'finds']):
+            if _EXPAND_REPORT_RE.search(title_lower):
                 expanded_parts.append("The findings provide valuable insights into current trends and may influence future decisions in the sector.")
             
-            if any(word in title_lower for word in ['government', 'policy', 'law', 'regulation']):
+            if _EXPAND_POLICY_RE.search(title_lower):
                 expanded_parts.append("This policy development could have significant implications for stakeholders and may affect related sectors.")
             
-            if any(word in title_lower for word in ['market', 'economy', 'financial', 'business']):
+            if _EXPAND_MARKET_RE.search(title_lower):
                 expanded_parts.append("Market analysts are closely monitoring these developments for potential impacts on economic indicators and investor sentiment.")
             
-            if any(word in title_lower for word in ['technology', 'tech', 'digital', 'ai', 'software']):
+            if _EXPAND_TECH_RE.search(title_lower):
                 expanded_parts.append("This technological advancement reflects the ongoing innovation in the digital landscape and could influence industry standards.")
             
-            if any(word in title_lower for word in ['health', 'medical', 'hospital', 'treatment']):
+            if _EXPAND_HEALTH_RE.search(title_lower):
                 expanded_parts.append("Healthcare professionals and patients are expected to benefit from these developments in medical care and treatment options.")
             
-            if any(word in title_lower for word in ['climate', 'environment', 'green', 'energy']):
+            if _EXPAND_CLIMATE_RE.search(title_lower):
                 expanded_parts.append("Environmental experts view this as part of broader efforts to address climate challenges and promote sustainable practices.")
             
-            if any(word in title_lower for word in ['election', 'political', 'vote', 'campaign']):
+            if _EXPAND_ELECTION_RE.search(title_lower):
                 expanded_parts.append("Political observers are analyzing the potential implications for upcoming electoral processes and policy directions.")
             
             # Add general contextual closure if we have enough content
@@ -556,31 +1263,31 @@ class RSSNewsFetcher:
             title_lower = title.lower()
             
             # Analyze title for context clues and add relevant information
-            if any(word in title_lower for word in ['cricket', 'player', 'batsman', 'bowler', 'match', 'tournament', 'ranji', 'ipl']):
+            if _FALLBACK_CRICKET_RE.search(title_lower):
                 parts.append("The cricket industry continues to evolve with new talent emerging regularly. Performance statistics and career trajectories are closely monitored by selectors and fans alike.")
                 parts.append("Such developments in domestic cricket often serve as stepping stones for players aspiring to represent their country at the international level.")
             
-            elif any(word in title_lower for word in ['technology', 'tech', 'ai', 'software', 'digital', 'app']):
+            elif _FALLBACK_TECH_RE.search(title_lower):
                 parts.append("The technology sector remains one of the fastest-growing industries globally, with continuous innovations shaping how we work and live.")
                 parts.append("These technological advancements often have far-reaching implications for businesses, consumers, and the broader economy.")
             
-            elif any(word in title_lower for word in ['business', 'company', 'market', 'economy', 'financial', 'investment']):
+            elif _FALLBACK_BUSINESS_RE.search(title_lower):
                 parts.append("Business developments like these often reflect broader market trends and economic conditions affecting various stakeholders.")
                 parts.append("Market analysts and investors closely monitor such announcements for potential impacts on industry dynamics and investment opportunities.")
             
-            elif any(word in title_lower for word in ['government', 'policy', 'political', 'minister', 'parliament', 'law']):
+            elif _FALLBACK_POLICY_RE.search(title_lower):
                 parts.append("Political and policy developments have significant implications for citizens and various sectors of the economy.")
                 parts.append("Such governmental actions often reflect broader policy directions and can influence future legislative and regulatory frameworks.")
             
-            elif any(word in title_lower for word in ['health', 'medical', 'hospital', 'treatment', 'healthcare', 'doctor']):
+            elif _FALLBACK_HEALTH_RE.search(title_lower):
                 parts.append("Healthcare developments are crucial for improving patient outcomes and advancing medical knowledge.")
                 parts.append("These medical advancements often represent collaborative efforts between healthcare professionals, researchers, and institutions.")
             
-            elif any(word in title_lower for word in ['education', 'school', 'university', 'student', 'academic', 'research']):
+            elif _FALLBACK_EDUCATION_RE.search(title_lower):
                 parts.append("Educational developments play a vital role in shaping future generations and advancing knowledge in various fields.")
                 parts.append("Such initiatives often involve collaboration between educational institutions, policymakers, and the broader community.")
             
-            elif any(word in title_lower for word in ['environment', 'climate', 'green', 'energy', 'sustainability', 'renewable']):
+            elif _FALLBACK_ENVIRONMENT_RE.search(title_lower):
                 parts.append("Environmental initiatives are increasingly important as societies work to address climate change and promote sustainable practices.")
                 parts.append("These efforts often require coordination between government agencies, private sector organizations, and environmental groups.")
             
@@ -627,17 +1334,20 @@ class RSSNewsFetcher:
 
     def extract_image_from_feed_entry(self, entry):
         """Extract image from RSS feed entry itself"""
-        # Check for media content in feed
+        # Check for media content in feed (many feeds only set medium="image")
         if hasattr(entry, 'media_content') and entry.media_content:
             for media in entry.media_content:
-                if media.get('type', '').startswith('image/'):
+                if media.get('url') and (media.get('type', '').startswith('image/') or media.get('medium') == 'image'):
                     return media.get('url')
         
-        # Check for enclosures
+        # Check for enclosures (rel="enclosure" links), accepting untyped ones
+        # whose URL looks like an image
         if hasattr(entry, 'enclosures') and entry.enclosures:
             for enclosure in entry.enclosures:
-                if enclosure.get('type', '').startswith('image/'):
-                    return enclosure.get('href')
+                href = enclosure.get('href', '')
+                enclosure_type = enclosure.get('type', '')
+                if href and (enclosure_type.startswith('image/') or (not enclosure_type and _IMG_EXT_RE.search(href))):
+                    return href
         
         # Check for media thumbnail
         if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
@@ -646,91 +1356,248 @@ class RSSNewsFetcher:
         # Check summary/description for images
         content = entry.get('summary', '') or entry.get('description', '')
         if content:
-            soup = BeautifulSoup(content, 'html.parser')
-            img = soup.find('img')
-            if img:
-                return img.get('src')
+            match = _IMG_SRC_RE.search(content)
+            if match:
+                # Summary HTML from the lxml feed reader is passed through
+                # as-is, so resolve relative sources against the article link
+                return urljoin(entry.get('link', ''), html.unescape(match.group(1)))
         
         return None
 
-    def process_feed(self, source_name, feed_url, category):
-        """Process a single RSS feed with advanced duplicate detection"""
-        articles = []
+    def _enrich_entry(self, entry, article, outcomes):
+        """Fill in a full description and image for one feed entry, appending outcome keys to outcomes"""
+        # The first feed to reach a story enriches it; concurrent and later
+        # copies wait for that result instead of fetching the page again
+        key = _canonicalize_url(article['url'])
+        with self.lock:
+            pending = self._enriched_cache.get(key)
+            owner = pending is None
+            if owner:
+                pending = concurrent.futures.Future()
+                self._enriched_cache[key] = pending
+        
+        if not owner:
+            enriched = pending.result()
+            if len(enriched['description']) > len(article['description']):
+                article['description'] = enriched['description']
+            article['image_url'] = enriched['image_url'] or self.extract_image_from_feed_entry(entry) or ''
+            return article
+        
         try:
-            print(f"Fetching {source_name} ({category})...")
+            self._enrich_article(entry, article, outcomes)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        pending.set_result({'description': article['description'], 'image_url': article['image_url']})
+        return article
+
+    def _enrich_article(self, entry, article, outcomes):
+        """Fetch the page content and image for an article not seen this run"""
+        # Check if description is too short and extract full content if needed
+        current_description = article['description']
+        MIN_DESCRIPTION_LENGTH = 300  # Minimum description length threshold for summary apps
+        
+        # Try to extract image from feed entry first
+        image_url = self.extract_image_from_feed_entry(entry)
+        page_image_url = None
+        host = urlsplit(article['url']).hostname
+        
+        if not current_description or len(current_description.strip()) < MIN_DESCRIPTION_LENGTH:
+            outcomes.append('short')
             
-            # Parse RSS feed
-            feed = feedparser.parse(feed_url)
+            # Try regular extraction first; when the feed has no image, the
+            # same page download also supplies the lead image
+            if image_url:
+                extracted_content = self._cached_extract('content', article['url'], self.extract_article_content)
+            else:
+                extracted_content, page_image_url = self._cached_extract_page(article['url'])
+            if extracted_content and len(extracted_content) > MIN_DESCRIPTION_LENGTH:
+                article['description'] = extracted_content
+                outcomes.append('requests')
+                with self.lock:
+                    self._requests_ok_hosts.add(host)
+            else:
+                with self.lock:
+                    works_without_js = host in self._requests_ok_hosts
+                    playwright_keeps_failing = (
+                        host not in self._js_required_hosts
+                        and self._playwright_misses[host] >= self.max_playwright_misses
+                    )
+                
+                # Fallback to Playwright for difficult sites; hosts that already
+                # served full text to plain requests don't need a browser
+                playwright_content = None
+                if works_without_js or playwright_keeps_failing:
+                    outcomes.append('playwright_skipped')
+                else:
+                    playwright_content = self.extract_content_with_playwright(article['url'])
+                    with self.lock:
+                        if playwright_content and len(playwright_content) > MIN_DESCRIPTION_LENGTH:
+                            self._js_required_hosts.add(host)
+                        else:
+                            self._playwright_misses[host] += 1
+                if playwright_content and len(playwright_content) > MIN_DESCRIPTION_LENGTH:
+                    article['description'] = playwright_content
+                    outcomes.append('playwright')
+                else:
+                    # Last resort: Try to intelligently expand the short description
+                    expanded_desc = self.expand_short_description(article['title'], current_description)
+                    if expanded_desc and len(expanded_desc) >= MIN_DESCRIPTION_LENGTH:
+                        article['description'] = expanded_desc
+                        outcomes.append('expanded')
+                    else:
+                        # Final fallback: Create a substantial description from title and any available content
+                        fallback_desc = self.create_fallback_description(article['title'], current_description)
+                        if fallback_desc and len(fallback_desc) >= MIN_DESCRIPTION_LENGTH:
+                            article['description'] = fallback_desc
+                            outcomes.append('fallback')
+                        else:
+                            outcomes.append('failed')
+        
+        # If no image in feed, try to extract from article page, unless the
+        # host has (almost) never had one. The page download above already
+        # answered unless only its text was cached
+        if not image_url and page_image_url is not None:
+            image_url = page_image_url
+            self._record_image_lookup(host, bool(image_url))
+        elif not image_url and article['url']:
+            if self._should_look_up_image(host):
+                image_url = self._cached_extract('image', article['url'], self.extract_image_from_article)
+                self._record_image_lookup(host, bool(image_url))
+            else:
+                outcomes.append('image_skipped')
+        
+        if image_url:
+            article['image_url'] = image_url
+
+    def _fetch_feed_articles(self, source_name, feed_url, category):
+        """Download, parse and enrich a feed, reusing the cached articles when it hasn't changed"""
+        # Conditional GET: an unchanged feed answers 304 with an empty body,
+        # skipping both the download and the parse
+        feed_key = self._feed_key(source_name, feed_url)
+        meta = self._feed_meta.get(feed_key, {})
+        conditional_headers = {}
+        if meta.get('etag'):
+            conditional_headers['If-None-Match'] = meta['etag']
+        if meta.get('modified'):
+            conditional_headers['If-Modified-Since'] = meta['modified']
+        
+        response = self._http_get(feed_url, headers=conditional_headers, timeout=(3, 10))
+        digest = None
+        if response.status_code != 304:
+            response.raise_for_status()
+            digest = hashlib.md5(response.content).hexdigest()
+        
+        # A 200 can still carry last run's feed: requests-cache answers its own
+        # revalidations from the store, and some servers send no validators
+        if response.status_code == 304 or digest == meta.get('digest'):
+            cached_articles = self._load_json(self._feed_cache_file(feed_key), None)
+            if cached_articles is not None:
+                print(f"  ♻️  {source_name} unchanged since last run, reusing {len(cached_articles)} cached articles")
+                return cached_articles
+            if digest is None:
+                # The cached copy is gone, so fetch the full feed again
+                response = self._http_get(feed_url, timeout=(3, 10))
+                response.raise_for_status()
+                digest = hashlib.md5(response.content).hexdigest()
+        
+        # Download through the pooled session, then read only the entries we
+        # use straight from the XML. Feeds lxml can't read go through
+        # feedparser; entry HTML is stripped by clean_html_content, so its
+        # sanitizer is skipped
+        feed_entries = _parse_feed_entries(response.content, response.url, 8)  # Limit to 8 articles per source for ~160 total
+        if feed_entries is None:
+            feed = feedparser.parse(response.content, response_headers={
+                'content-type': response.headers.get('content-type', ''),
+                'content-location': response.url
+            }, sanitize_html=False)
             
             if feed.bozo and feed.bozo_exception:
                 print(f"Warning: Feed parsing issue for {source_name}: {feed.bozo_exception}")
+            feed_entries = feed.entries[:8]
+        
+        entries = []
+        base_articles = []
+        for entry in feed_entries:
+            # Extract basic article info
+            # Clean description from HTML tags and links
+            raw_description = (entry.get('summary') or entry.get('description') or '').strip()
+            clean_description = self.clean_html_content(raw_description)
             
-            raw_articles = []
-            for entry in feed.entries[:8]:  # Limit to 8 articles per source for ~160 total
-                # Extract basic article info
-                # Clean description from HTML tags and links
-                raw_description = (entry.get('summary') or entry.get('description') or '').strip()
-                clean_description = self.clean_html_content(raw_description)
-                
-                article = {
-                    'title': entry.get('title', '').strip(),
-                    'url': entry.get('link', ''),  # Changed from 'link' to 'url'
-                    'published': entry.get('published', ''),
-                    'description': clean_description,
-                    'source': source_name,  # Use the RSS source name
-                    'category': category,
-                    'image_url': ''
-                }
-                
-                # Skip articles without title or url
-                if not article['title'] or not article['url']:
-                    continue
-                
-                # Check if description is too short and extract full content if needed
-                current_description = article['description']
-                MIN_DESCRIPTION_LENGTH = 300  # Minimum description length threshold for summary apps
-                
-                if not current_description or len(current_description.strip()) < MIN_DESCRIPTION_LENGTH:
-                    print(f"    📄 Short description detected for '{article['title'][:50]}...', extracting full content...")
-                    
-                    # Try regular extraction first
-                    extracted_content = self.extract_article_content(article['url'])
-                    if extracted_content and len(extracted_content) > MIN_DESCRIPTION_LENGTH:
-                        article['description'] = extracted_content
-                        print(f"    ✅ Enhanced description: {len(extracted_content)} characters (requests)")
-                    else:
-                        # Fallback to Playwright for difficult sites
-                        print(f"    🔄 Regular extraction failed, trying Playwright...")
-                        playwright_content = self.extract_content_with_playwright(article['url'])
-                        if playwright_content and len(playwright_content) > MIN_DESCRIPTION_LENGTH:
-                            article['description'] = playwright_content
-                            print(f"    ✅ Enhanced description: {len(playwright_content)} characters (Playwright)")
-                        else:
-                            # Last resort: Try to intelligently expand the short description
-                            expanded_desc = self.expand_short_description(article['title'], current_description)
-                            if expanded_desc and len(expanded_desc) >= MIN_DESCRIPTION_LENGTH:
-                                article['description'] = expanded_desc
-                                print(f"    ✅ Expanded short description: {len(expanded_desc)} characters (intelligent expansion)")
-                            else:
-                                # Final fallback: Create a substantial description from title and any available content
-                                fallback_desc = self.create_fallback_description(article['title'], current_description)
-                                if fallback_desc and len(fallback_desc) >= MIN_DESCRIPTION_LENGTH:
-                                    article['description'] = fallback_desc
-                                    print(f"    ✅ Created fallback description: {len(fallback_desc)} characters (fallback generation)")
-                                else:
-                                    print(f"    ❌ All methods failed - skipping article with insufficient content")
-                
-                # Try to extract image from feed entry first
-                image_url = self.extract_image_from_feed_entry(entry)
-                
-                # If no image in feed, try to extract from article page
-                if not image_url and article['url']:
-                    image_url = self.extract_image_from_article(article['url'])
-                
-                if image_url:
-                    article['image_url'] = image_url
-                
-                raw_articles.append(article)
+            # Full-text feeds put the article body in <content:encoded>; using
+            # it avoids fetching the page (or rendering it in Playwright)
+            if len(clean_description) < 300 and entry.get('content'):
+                full_content = self.clean_html_content(entry.content[0].get('value', ''))
+                if len(full_content) >= 300:
+                    clean_description = _summarize_text(full_content, 10, 2000)
+            
+            article = {
+                'title': entry.get('title', '').strip(),
+                'url': entry.get('link', ''),  # Changed from 'link' to 'url'
+                'published': entry.get('published', ''),
+                'description': clean_description,
+                'source': source_name,  # Use the RSS source name
+                'category': category,
+                'image_url': ''
+            }
+            
+            # Skip articles without title or url
+            if not article['title'] or not article['url']:
+                continue
+            
+            entries.append(entry)
+            base_articles.append(article)
+        
+        # The file-based history drops URLs it has already seen after
+        # enrichment, so check them in one batch and skip fetching their pages
+        if not self.use_space_optimization and self.history_manager and base_articles:
+            new_urls = self.history_manager.filter_new([article['url'] for article in base_articles], source_name)
+            if len(new_urls) < len(base_articles):
+                print(f"  ⏭️  {source_name}: skipping {len(base_articles) - len(new_urls)} already-seen articles")
+                kept = [(entry, article) for entry, article in zip(entries, base_articles) if article['url'] in new_urls]
+                entries = [entry for entry, _ in kept]
+                base_articles = [article for _, article in kept]
+        
+        # Enrich entries in parallel; each one is dominated by network waits.
+        # Workers only record outcome keys, summarised in one line per feed
+        # so they don't contend for stdout on every step
+        raw_articles = []
+        if entries:
+            outcomes = []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                raw_articles = list(executor.map(
+                    functools.partial(self._enrich_entry, outcomes=outcomes), entries, base_articles
+                ))
+            counts = Counter(outcomes)
+            summary = ', '.join(f"{counts[key]} {label}" for key, label in _ENRICH_OUTCOME_LABELS if counts[key])
+            if summary:
+                print(f"  📄 {source_name}: {summary}")
+        
+        # Remember the validators and body digest alongside a copy of the
+        # articles they describe
+        with self.lock:
+            self._feed_meta[feed_key] = {
+                'etag': response.headers.get('ETag'),
+                'modified': response.headers.get('Last-Modified'),
+                'digest': digest
+            }
+            self._feed_articles[feed_key] = [dict(article) for article in raw_articles]
+        
+        return raw_articles
+
+    def process_feed(self, source_name, feed_url, category):
+        """Process a single RSS feed with advanced duplicate detection
+        
+        Returns (articles, image_count) so callers don't rescan for images
+        """
+        articles = []
+        image_count = 0
+        started = time.perf_counter()
+        try:
+            print(f"Fetching {source_name} ({category})...")
+            
+            raw_articles = self._fetch_feed_articles(source_name, feed_url, category)
+            raw_image_count = sum(1 for article in raw_articles if article['image_url'])
             
             # Apply SHARED DATABASE duplicate detection
             if self.use_space_optimization and raw_articles:
@@ -747,14 +1614,16 @@ class RSSNewsFetcher:
                 
                 # Return all articles (database already handled duplicates)
                 articles = raw_articles
+                image_count = raw_image_count
                 
             elif hasattr(self, 'history_manager') and self.history_manager and raw_articles:
                 # Fallback to file-based duplicate detection
                 print(f"  🧠 Applying file-based duplicate detection for {source_name}...")
                 unique_articles, duplicate_stats = self.history_manager.check_duplicates_advanced(
-                    raw_articles, source_name
+                    raw_articles, source_name, defer_save=True
                 )
                 articles = unique_articles
+                image_count = sum(1 for article in unique_articles if article['image_url'])
                 
                 print(f"  📊 {source_name} file-based detection:")
                 print(f"    📰 Raw articles: {len(raw_articles)}")
@@ -763,17 +1632,68 @@ class RSSNewsFetcher:
             else:
                 # No duplicate detection available
                 articles = raw_articles
+                image_count = raw_image_count
                 print(f"  ⚠️  No duplicate detection for {source_name} (no system available)")
                 
         except Exception as e:
             print(f"Error processing feed {source_name}: {e}")
         
-        return articles
+        with self.lock:
+            self.feed_durations[feed_url] = round(time.perf_counter() - started, 2)
+        
+        return articles, image_count
 
-    def fetch_all_news(self, max_workers=5):
+    def _on_feed_done(self, source_name, category, news_data, seen_urls, log_lines, future):
+        """Merge a finished feed into news_data (runs on the worker thread)"""
+        try:
+            articles, image_count = future.result()
+            
+            with self.lock:
+                # Skip stories another feed already contributed this run (the
+                # same story is often syndicated across category feeds)
+                unique_articles = []
+                for article in articles:
+                    key = _canonicalize_url(article['url'])
+                    if key not in seen_urls:
+                        seen_urls.add(key)
+                        unique_articles.append(article)
+                if len(unique_articles) != len(articles):
+                    articles = unique_articles
+                    image_count = sum(1 for article in articles if article['image_url'])
+                
+                # Add articles to category
+                news_data['by_category'][category].extend(articles)
+                
+                # Add articles to source
+                news_data['by_source'][source_name] = articles
+                
+                # Track feed status
+                news_data['feed_status'][source_name] = {
+                    'status': 'success',
+                    'articles_count': len(articles),
+                    'category': category
+                }
+                
+                # Keep running statistics so no second pass is needed
+                news_data['total_articles'] += len(articles)
+                news_data['articles_with_images'] += image_count
+                news_data['sources_processed'] += 1
+            
+            log_lines.append(f"✅ {source_name}: {len(articles)} articles")
+            
+        except Exception as e:
+            log_lines.append(f"❌ {source_name}: Failed - {e}")
+            with self.lock:
+                news_data['feed_status'][source_name] = {
+                    'status': 'failed',
+                    'error': str(e),
+                    'category': category
+                }
+
+    def fetch_all_news(self, max_workers=16):
         """Fetch news from all RSS feeds"""
         print("🚀 Starting RSS news extraction...")
-        print(f"📡 Processing {sum(len(feeds) for feeds in self.rss_feeds.values())} RSS feeds...")
+        print(f"📡 Processing {len(self.FEED_TASKS)} RSS feeds...")
         
         news_data = {
             'extraction_timestamp': datetime.datetime.now().isoformat(),
@@ -781,67 +1701,48 @@ class RSSNewsFetcher:
             'articles_with_images': 0,
             'image_success_rate': '0%',
             'sources_processed': 0,
-            'categories': list(self.rss_feeds.keys()),
+            'categories': list(self.RSS_FEEDS.keys()),
             'by_category': {},
             'by_source': {},
             'feed_status': {}
         }
         
         # Initialize category data
-        for category in self.rss_feeds.keys():
+        for category in self.RSS_FEEDS.keys():
             news_data['by_category'][category] = []
         
-        all_tasks = []
+        # Longest-running feeds first (new feeds ahead of all of them), so
+        # the slowest ones aren't left queued behind a full worker pool
+        all_tasks = sorted(
+            self.FEED_TASKS, key=lambda task: self.feed_durations.get(task[1], float('inf')), reverse=True
+        )
         
-        # Prepare all feed processing tasks
-        for category, feeds in self.rss_feeds.items():
-            for source_name, feed_url in feeds.items():
-                all_tasks.append((source_name, feed_url, category))
+        # Per-feed completion lines are buffered and written once at the end
+        # so workers don't serialize on stdout as they finish
+        log_lines = []
+        seen_urls = set()
         
-        # Process feeds concurrently
+        # Process feeds concurrently; each future settles its own results
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_task = {
-                executor.submit(self.process_feed, source_name, feed_url, category): (source_name, category)
-                for source_name, feed_url, category in all_tasks
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_task):
-                source_name, category = future_to_task[future]
-                try:
-                    articles = future.result()
-                    
-                    # Add articles to category
-                    news_data['by_category'][category].extend(articles)
-                    
-                    # Add articles to source
-                    news_data['by_source'][source_name] = articles
-                    
-                    # Track feed status
-                    news_data['feed_status'][source_name] = {
-                        'status': 'success',
-                        'articles_count': len(articles),
-                        'category': category
-                    }
-                    
-                    print(f"✅ {source_name}: {len(articles)} articles")
-                    
-                except Exception as e:
-                    print(f"❌ {source_name}: Failed - {e}")
-                    news_data['feed_status'][source_name] = {
-                        'status': 'failed',
-                        'error': str(e),
-                        'category': category
-                    }
-        
-        # Calculate statistics
-        all_articles = []
-        for category, articles in news_data['by_category'].items():
-            all_articles.extend(articles)
-        
-        news_data['total_articles'] = len(all_articles)
-        news_data['articles_with_images'] = sum(1 for article in all_articles if article.get('image_url'))
-        news_data['sources_processed'] = len([status for status in news_data['feed_status'].values() if status['status'] == 'success'])
+            for source_name, feed_url, category in all_tasks:
+                future = executor.submit(self.process_feed, source_name, feed_url, category)
+                future.add_done_callback(
+                    functools.partial(self._on_feed_done, source_name, category, news_data, seen_urls, log_lines)
+                )
         
+        if log_lines:
+            print('\n'.join(log_lines))
+        
+        # No more Playwright fallbacks this run; don't leave Chromium running
+        # until interpreter exit
+        self.stop_browser()
+        
+        # Feeds left their history updates in memory; write them all at once
+        if getattr(self, 'history_manager', None):
+            self.history_manager.flush_all()
+        self.save_state()
+        
+        # Calculate statistics (counts were accumulated as feeds completed)
         if news_data['total_articles'] > 0:
             image_success_rate = (news_data['articles_with_images'] / news_data['total_articles']) * 100
             news_data['image_success_rate'] = f"{image_success_rate:.1f}%"
@@ -850,7 +1751,7 @@ class RSSNewsFetcher:
         if hasattr(self, 'history_manager') and self.history_manager:
             print("\n📊 RSS History Statistics:")
             total_historical = 0
-            for category, feeds in self.rss_feeds.items():
+            for category, feeds in self.RSS_FEEDS.items():
                 for source_name in feeds.keys():
                     stats = self.history_manager.get_feed_statistics(source_name)
                     total_historical += stats['total_articles_seen']
@@ -876,11 +1777,23 @@ class RSSNewsFetcher:
         return news_data
 
     def save_to_json(self, news_data, filename='data/rss_news_data.json'):
-        """Save news data to JSON file"""
+        """Save news data to JSON file and return the number of bytes written"""
         os.makedirs('data', exist_ok=True)
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(news_data, f, indent=2, ensure_ascii=False)
+        # Compact JSON: indentation only adds bytes and encoder work
+        if orjson is not None:
+            # orjson always emits UTF-8 bytes, matching ensure_ascii=False
+            payload = orjson.dumps(news_data, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(news_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        
+        # Write to a sibling temp file and swap it in atomically so a crash
+        # mid-write never leaves a truncated JSON behind
+        tmp_filename = filename + '.tmp'
+        with open(tmp_filename, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_filename, filename)
         print(f"💾 News data saved to {filename}")
+        return len(payload)
     
     def cleanup_old_rss_history(self, days_to_keep=30):
         """Clean up old RSS history files"""
@@ -901,7 +1814,7 @@ class RSSNewsFetcher:
             'feeds': {}
         }
         
-        for category, feeds in self.rss_feeds.items():
+        for category, feeds in self.RSS_FEEDS.items():
             for source_name in feeds.keys():
                 stats = self.history_manager.get_feed_statistics(source_name)
                 summary['feeds'][source_name] = stats
@@ -911,11 +1824,45 @@ class RSSNewsFetcher:
         
         return summary
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fetch news articles from RSS feeds')
+    parser.add_argument('--quiet', action='store_true',
+                        help='print a single-line JSON summary instead of the full report')
+    parser.add_argument('--json-only', action='store_true',
+                        help='only fetch and save the data, without printing a summary')
+    args = parser.parse_args(argv)
+    
+    if args.json_only or args.quiet:
+        # Progress output from the fetcher and history managers would bury the
+        # summary line, so everything printed while fetching is discarded
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            fetcher = RSSNewsFetcher()
+            try:
+                news_data = fetcher.fetch_all_news()
+                file_size = fetcher.save_to_json(news_data)
+            finally:
+                fetcher.close()
+        if args.quiet:
+            summary = {
+                'total_articles': news_data['total_articles'],
+                'articles_with_images': news_data['articles_with_images'],
+                'image_success_rate': news_data['image_success_rate'],
+                'sources_processed': news_data['sources_processed'],
+                'file_size_bytes': file_size
+            }
+            if orjson is not None:
+                print(orjson.dumps(summary).decode())
+            else:
+                print(json.dumps(summary))
+        return news_data
+    
     fetcher = RSSNewsFetcher()
     
     # Fetch news from all RSS feeds
-    news_data = fetcher.fetch_all_news()
+    try:
+        news_data = fetcher.fetch_all_news()
+    finally:
+        fetcher.close()
     
     # Print summary
     print("\n" + "="*60)
@@ -939,10 +1886,10 @@ def main():
             print(f"  {status_icon} {source}: {status.get('error', 'Unknown error')}")
     
     # Save to JSON file
-    fetcher.save_to_json(news_data)
+    file_size = fetcher.save_to_json(news_data)
     
-    print(f"\n🎉 Complete! Your news data is saved in 'rss_news_data.json'")
-    print(f"📁 File size: {os.path.getsize('rss_news_data.json') / 1024:.1f} KB")
+    print(f"\n🎉 Complete! Your news data is saved in 'data/rss_news_data.json'")
+    print(f"📁 File size: {file_size / 1024:.1f} KB")
     
     return news_data
 
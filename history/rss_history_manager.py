@@ -9,8 +9,7 @@ import hashlib
 import datetime
 from typing import List, Dict, Set, Tuple
 from difflib import SequenceMatcher
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import CountVectorizer
 import numpy as np
 
 class RSSHistoryManager:
@@ -24,6 +23,10 @@ class RSSHistoryManager:
         self.title_similarity_threshold = 0.85
         self.content_similarity_threshold = 0.75
         self.fuzzy_title_threshold = 0.80
+        self.content_max_features = 1000
+        
+        # Histories updated with defer_save=True, written by flush_all()
+        self._pending_histories = {}
         
         print(f"📂 RSS History Manager initialized: {history_dir}")
     
@@ -36,6 +39,9 @@ class RSSHistoryManager:
     
     def _load_feed_history(self, source_name: str) -> Dict:
         """Load historical articles for a specific RSS feed"""
+        if source_name in self._pending_histories:
+            return self._pending_histories[source_name]
+        
         history_file = self._get_feed_history_file(source_name)
         
         if os.path.exists(history_file):
@@ -66,8 +72,11 @@ class RSSHistoryManager:
             history_copy['title_hashes'] = list(history.get('title_hashes', set()))
             history_copy['last_updated'] = datetime.datetime.now().isoformat()
             
-            with open(history_file, 'w', encoding='utf-8') as f:
+            # Write a temp file and swap it in so a crash can't truncate the history
+            tmp_file = history_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(history_copy, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, history_file)
                 
         except Exception as e:
             print(f"❌ Error saving history for {source_name}: {e}")
@@ -140,37 +149,82 @@ class RSSHistoryManager:
         # Return the maximum similarity
         return max(seq_similarity, word_similarity)
     
-    def _calculate_content_similarity(self, article1: Dict, article2: Dict) -> float:
-        """Calculate content similarity using TF-IDF and cosine similarity"""
+    def _calculate_content_similarities(self, article: Dict, candidates: List[Dict]) -> np.ndarray:
+        """
+        TF-IDF cosine similarity of article against every candidate
+
+        Each score equals fitting TfidfVectorizer(stop_words='english',
+        max_features=1000, ngram_range=(1, 2)) on just that pair, but all
+        texts are tokenized once and scored together
+        """
+        similarities = np.zeros(len(candidates))
+        content = f"{article.get('title', '')} {article.get('description', '')}"
+        if not candidates or len(content.strip()) < 20:
+            return similarities
+        
+        candidate_contents = [f"{c.get('title', '')} {c.get('description', '')}" for c in candidates]
+        usable = np.array([len(c.strip()) >= 20 for c in candidate_contents])
+        if not usable.any():
+            return similarities
+        
         try:
-            # Extract content
-            content1 = f"{article1.get('title', '')} {article1.get('description', '')}"
-            content2 = f"{article2.get('title', '')} {article2.get('description', '')}"
-            
-            # Skip if content is too short
-            if len(content1.strip()) < 20 or len(content2.strip()) < 20:
-                return 0.0
-            
-            # Create TF-IDF vectors
-            vectorizer = TfidfVectorizer(
-                stop_words='english',
-                max_features=1000,
-                ngram_range=(1, 2),
-                min_df=1
-            )
-            
-            tfidf_matrix = vectorizer.fit_transform([content1, content2])
-            similarity_matrix = cosine_similarity(tfidf_matrix)
-            
-            return float(similarity_matrix[0, 1])
-            
-        except Exception as e:
-            print(f"⚠️  Error calculating content similarity: {e}")
-            return 0.0
+            vectorizer = CountVectorizer(stop_words='english', ngram_range=(1, 2), min_df=1)
+            counts = vectorizer.fit_transform(
+                [content] + [c for c, ok in zip(candidate_contents, usable) if ok]
+            ).toarray()
+        except ValueError:
+            # Nothing but stop words anywhere
+            return similarities
+        
+        a, b = counts[0], counts[1:]
+        scores = self._two_document_cosines(a.astype(float), b.astype(float))
+        
+        # Pairs with more terms than the cap keep only their most frequent
+        # ones; columns are in vocabulary order, as in a per-pair fit, so the
+        # same argsort picks the same terms
+        pair_terms = (a > 0) | (b > 0)
+        for row in np.flatnonzero(pair_terms.sum(axis=1) > self.content_max_features):
+            columns = np.flatnonzero(pair_terms[row])
+            kept = columns[(-(a[columns] + b[row, columns])).argsort()[:self.content_max_features]]
+            scores[row] = self._two_document_cosines(
+                a[kept].astype(float), b[row:row + 1, kept].astype(float)
+            )[0]
+        
+        similarities[usable] = scores
+        return similarities
     
-    def check_duplicates_advanced(self, new_articles: List[Dict], source_name: str) -> Tuple[List[Dict], Dict]:
+    @staticmethod
+    def _two_document_cosines(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Cosine of a against each row of b, as a TF-IDF fit on that pair alone would weight them"""
+        # A two-document fit gives terms found in both documents an idf of 1
+        # and terms found in only one an idf of 1 + ln(3/2); only shared terms
+        # contribute to the dot product
+        a_sq, b_sq = a * a, b * b
+        unshared_weight = (1 + np.log(1.5)) ** 2
+        dot = b @ a
+        a_norm_sq = unshared_weight * a_sq.sum() + (1 - unshared_weight) * ((b > 0) @ a_sq)
+        b_norm_sq = unshared_weight * b_sq.sum(axis=1) + (1 - unshared_weight) * (b_sq @ (a > 0))
+        denom = np.sqrt(a_norm_sq * b_norm_sq)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denom > 0, dot / denom, 0.0)
+    
+    def filter_new(self, urls: List[str], source_name: str) -> Set[str]:
+        """
+        Return the URLs this RSS feed has not seen before, with a single history read
+        """
+        url_hashes = set(self._load_feed_history(source_name).get('url_hashes', []))
+        return {
+            url for url in urls
+            if hashlib.md5(self._normalize_url(url).encode('utf-8')).hexdigest() not in url_hashes
+        }
+    
+    def check_duplicates_advanced(self, new_articles: List[Dict], source_name: str,
+                                  defer_save: bool = False) -> Tuple[List[Dict], Dict]:
         """
         Advanced duplicate detection using multiple algorithms and historical data
+        
+        With defer_save=True the updated history is kept in memory until
+        flush_all() is called, keeping the file write off the fetch path
         """
         print(f"🔍 Advanced duplicate checking for {source_name} ({len(new_articles)} articles)...")
         
@@ -244,16 +298,14 @@ class RSSHistoryManager:
             if not is_duplicate:
                 # Check content similarity against recent articles
                 recent_articles = historical_articles[-50:] if len(historical_articles) > 50 else historical_articles
+                content_similarities = self._calculate_content_similarities(article, recent_articles)
+                matches = np.flatnonzero(content_similarities >= self.content_similarity_threshold)
                 
-                for hist_article in recent_articles:
-                    content_similarity = self._calculate_content_similarity(article, hist_article)
-                    
-                    if content_similarity >= self.content_similarity_threshold:
-                        is_duplicate = True
-                        detection_method = 'content_similarity'
-                        similarity_score = content_similarity
-                        duplicate_stats['content_duplicates'] += 1
-                        break
+                if matches.size:
+                    is_duplicate = True
+                    detection_method = 'content_similarity'
+                    similarity_score = float(content_similarities[matches[0]])
+                    duplicate_stats['content_duplicates'] += 1
             
             if not is_duplicate:
                 # Article is unique - add to results and update history
@@ -295,7 +347,10 @@ class RSSHistoryManager:
             'total_articles_seen': history.get('total_articles_seen', 0) + len(new_articles)
         })
         
-        self._save_feed_history(source_name, history)
+        if defer_save:
+            self._pending_histories[source_name] = history
+        else:
+            self._save_feed_history(source_name, history)
         
         # Print detailed results
         print(f"  📊 Advanced duplicate detection results:")
@@ -310,6 +365,14 @@ class RSSHistoryManager:
         
         return new_unique_articles, duplicate_stats
     
+    def flush_all(self):
+        """Write every history left pending by check_duplicates_advanced(defer_save=True)"""
+        pending, self._pending_histories = self._pending_histories, {}
+        for source_name, history in pending.items():
+            self._save_feed_history(source_name, history)
+        if pending:
+            print(f"💾 Saved RSS history for {len(pending)} feeds")
+    
     def get_feed_statistics(self, source_name: str) -> Dict:
         """Get statistics for a specific RSS feed"""
         history = self._load_feed_history(source_name)